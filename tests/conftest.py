@@ -2,33 +2,73 @@
 Test configuration and fixtures for the FastAPI application tests.
 """
 
+import pickle
+
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to the original state after each test."""
-    # Store original state
-    original_activities = {
-        activity_name: {
-            "description": activity["description"],
-            "schedule": activity["schedule"], 
-            "max_participants": activity["max_participants"],
-            "participants": activity["participants"].copy()
-        }
-        for activity_name, activity in activities.items()
-    }
-    
+    """Create a test client shared by every test in the session.
+
+    Under pytest-xdist each worker runs its own session, so every worker
+    gets its own client and its own copy of the in-memory activities.
+    Entering the client runs the app's lifespan once for the whole session.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client for tests that issue concurrent requests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Snapshot the original activities once for the whole test session."""
+    return pickle.dumps(activities, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _restore_activities(snapshot):
+    """Replace the contents of activities with a fresh copy of the snapshot."""
+    act = activities
+    act.clear()
+    act.update(pickle.loads(snapshot))
+
+
+@pytest.fixture(scope="class")
+def reset_activities_class(_pristine_activities):
+    """Reset activities to the original state once, after the whole class.
+
+    Only suitable for classes whose tests use distinct (activity, email)
+    pairs and never assert on absolute participant counts.
+    """
     yield
-    
+
+    _restore_activities(_pristine_activities)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request, _pristine_activities):
+    """Reset activities to the original state after each test.
+
+    Tests marked ``readonly`` do not mutate activities, and tests using
+    ``reset_activities_class`` are restored at class teardown instead, so
+    the per-test restore is skipped for both.
+    """
+    yield
+
+    if request.node.get_closest_marker("readonly"):
+        return
+    if "reset_activities_class" in request.fixturenames:
+        return
+
     # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+    _restore_activities(_pristine_activities)
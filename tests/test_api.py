@@ -1,29 +1,39 @@
 """
 Test suite for the High School Management System API endpoints.
+
+PYTEST_DONT_REWRITE: failures show a bare AssertionError; remove this marker locally for detailed diffs.
 """
 
 import pytest
 from fastapi import status
+from src.app import activities
+
+OK = status.HTTP_200_OK
+TEMPORARY_REDIRECT = status.HTTP_307_TEMPORARY_REDIRECT
+BAD_REQUEST = status.HTTP_400_BAD_REQUEST
+NOT_FOUND = status.HTTP_404_NOT_FOUND
 
 
 class TestRootEndpoint:
     """Test cases for the root endpoint."""
     
+    @pytest.mark.readonly
     def test_root_redirects_to_static_index(self, client):
         """Test that the root endpoint redirects to static/index.html."""
         response = client.get("/", follow_redirects=False)
-        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        assert response.status_code == TEMPORARY_REDIRECT
         assert response.headers["location"] == "/static/index.html"
 
 
 class TestActivitiesEndpoint:
     """Test cases for the activities endpoint."""
     
-    def test_get_activities_success(self, client, reset_activities):
+    @pytest.mark.readonly
+    def test_get_activities_success(self, client):
         """Test that GET /activities returns all activities."""
         response = client.get("/activities")
         
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == OK
         data = response.json()
         
         # Verify structure
@@ -47,123 +57,104 @@ class TestActivitiesEndpoint:
 class TestActivitySignup:
     """Test cases for activity signup functionality."""
     
-    def test_signup_for_activity_success(self, client, reset_activities):
-        """Test successful signup for an activity."""
-        activity_name = "Chess Club"
-        email = "test@mergington.edu"
+    @pytest.mark.parametrize("activity_name,email", [
+        ("Chess Club", "test@mergington.edu"),
+        ("Programming Class", "newstudent@mergington.edu"),
+    ])
+    def test_signup_for_activity_success(self, client, reset_activities_class, activity_name, email):
+        """Test successful signup for an activity with existing participants."""
+        # Get initial participant count
+        initial_count = len(activities[activity_name]["participants"])
         
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        response = client.post(f"/activities/{activity_name}/signup", params={"email": email})
         
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == OK
         data = response.json()
         assert data["message"] == f"Signed up {email} for {activity_name}"
         
         # Verify the user was actually added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity_name]["participants"]
+        updated_participants = activities[activity_name]["participants"]
+        assert len(updated_participants) == initial_count + 1
+        assert email in updated_participants
     
-    def test_signup_for_nonexistent_activity(self, client, reset_activities):
+    def test_signup_for_nonexistent_activity(self, client, reset_activities_class):
         """Test signup for an activity that doesn't exist."""
         activity_name = "Nonexistent Club"
         email = "test@mergington.edu"
         
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        response = client.post(f"/activities/{activity_name}/signup", params={"email": email})
         
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == NOT_FOUND
         data = response.json()
         assert data["detail"] == "Activity not found"
     
-    def test_signup_duplicate_email(self, client, reset_activities):
+    def test_signup_duplicate_email(self, client, reset_activities_class):
         """Test that signing up with an already registered email fails."""
         activity_name = "Chess Club"
         email = "michael@mergington.edu"  # Already registered
         
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        response = client.post(f"/activities/{activity_name}/signup", params={"email": email})
         
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == BAD_REQUEST
         data = response.json()
         assert data["detail"] == "Student already signed up for this activity"
-    
-    def test_signup_new_email_to_existing_activity(self, client, reset_activities):
-        """Test signing up a new email to an activity that has existing participants."""
-        activity_name = "Programming Class"
-        new_email = "newstudent@mergington.edu"
-        
-        # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_participants = initial_response.json()[activity_name]["participants"]
-        initial_count = len(initial_participants)
-        
-        response = client.post(f"/activities/{activity_name}/signup?email={new_email}")
-        
-        assert response.status_code == status.HTTP_200_OK
-        
-        # Verify the participant was added
-        updated_response = client.get("/activities")
-        updated_participants = updated_response.json()[activity_name]["participants"]
-        assert len(updated_participants) == initial_count + 1
-        assert new_email in updated_participants
 
 
 class TestActivityUnregister:
     """Test cases for activity unregistration functionality."""
     
-    def test_unregister_from_activity_success(self, client, reset_activities):
+    def test_unregister_from_activity_success(self, client):
         """Test successful unregistration from an activity."""
         activity_name = "Chess Club"
         email = "michael@mergington.edu"  # Already registered
         
-        response = client.post(f"/activities/{activity_name}/unregister?email={email}")
+        response = client.post(f"/activities/{activity_name}/unregister", params={"email": email})
         
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == OK
         data = response.json()
         assert data["message"] == f"Removed {email} from {activity_name}"
         
         # Verify the user was actually removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity_name]["participants"]
+        assert email not in activities[activity_name]["participants"]
     
-    def test_unregister_from_nonexistent_activity(self, client, reset_activities):
+    @pytest.mark.readonly
+    def test_unregister_from_nonexistent_activity(self, client):
         """Test unregistration from an activity that doesn't exist."""
         activity_name = "Nonexistent Club"
         email = "test@mergington.edu"
         
-        response = client.post(f"/activities/{activity_name}/unregister?email={email}")
+        response = client.post(f"/activities/{activity_name}/unregister", params={"email": email})
         
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == NOT_FOUND
         data = response.json()
         assert data["detail"] == "Activity not found"
     
-    def test_unregister_email_not_registered(self, client, reset_activities):
+    @pytest.mark.readonly
+    def test_unregister_email_not_registered(self, client):
         """Test unregistering an email that's not registered for the activity."""
         activity_name = "Chess Club"
         email = "notregistered@mergington.edu"
         
-        response = client.post(f"/activities/{activity_name}/unregister?email={email}")
+        response = client.post(f"/activities/{activity_name}/unregister", params={"email": email})
         
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == BAD_REQUEST
         data = response.json()
         assert data["detail"] == "Student is not signed up for this activity"
     
-    def test_unregister_reduces_participant_count(self, client, reset_activities):
+    def test_unregister_reduces_participant_count(self, client):
         """Test that unregistering reduces the participant count."""
         activity_name = "Programming Class"
         email = "emma@mergington.edu"  # Already registered
         
         # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_participants = initial_response.json()[activity_name]["participants"]
-        initial_count = len(initial_participants)
+        initial_count = len(activities[activity_name]["participants"])
         
-        response = client.post(f"/activities/{activity_name}/unregister?email={email}")
+        response = client.post(f"/activities/{activity_name}/unregister", params={"email": email})
         
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == OK
         
         # Verify the participant count decreased
-        updated_response = client.get("/activities")
-        updated_participants = updated_response.json()[activity_name]["participants"]
+        updated_participants = activities[activity_name]["participants"]
         assert len(updated_participants) == initial_count - 1
         assert email not in updated_participants
 
@@ -171,52 +162,47 @@ class TestActivityUnregister:
 class TestActivityDataIntegrity:
     """Test cases for ensuring data integrity across operations."""
     
-    def test_signup_and_unregister_cycle(self, client, reset_activities):
+    def test_signup_and_unregister_cycle(self, client):
         """Test signup followed by unregister restores original state."""
         activity_name = "Art Workshop"
         email = "cyclictest@mergington.edu"
         
         # Get initial state
-        initial_response = client.get("/activities")
-        initial_participants = initial_response.json()[activity_name]["participants"].copy()
+        initial_participants = activities[activity_name]["participants"][:]
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity_name}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
+        signup_response = client.post(f"/activities/{activity_name}/signup", params={"email": email})
+        assert signup_response.status_code == OK
         
         # Verify signup
-        after_signup_response = client.get("/activities")
-        after_signup_participants = after_signup_response.json()[activity_name]["participants"]
+        after_signup_participants = activities[activity_name]["participants"]
         assert email in after_signup_participants
         assert len(after_signup_participants) == len(initial_participants) + 1
         
         # Unregister
-        unregister_response = client.post(f"/activities/{activity_name}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
+        unregister_response = client.post(f"/activities/{activity_name}/unregister", params={"email": email})
+        assert unregister_response.status_code == OK
         
         # Verify back to original state
-        final_response = client.get("/activities")
-        final_participants = final_response.json()[activity_name]["participants"]
+        final_participants = activities[activity_name]["participants"]
         assert final_participants == initial_participants
     
-    def test_multiple_activities_independent(self, client, reset_activities):
+    def test_multiple_activities_independent(self, client):
         """Test that operations on one activity don't affect others."""
         email = "independence@mergington.edu"
+        target_activity = "Soccer Team"
         
-        # Get initial state of all activities
-        initial_response = client.get("/activities")
-        initial_activities = initial_response.json()
+        # Get initial state of all other activities
+        before = {
+            activity_name: tuple(activity["participants"])
+            for activity_name, activity in activities.items()
+            if activity_name != target_activity
+        }
         
         # Sign up for one activity
-        target_activity = "Soccer Team"
-        client.post(f"/activities/{target_activity}/signup?email={email}")
+        client.post(f"/activities/{target_activity}/signup", params={"email": email})
         
         # Verify other activities unchanged
-        updated_response = client.get("/activities")
-        updated_activities = updated_response.json()
-        
-        for activity_name, activity_data in initial_activities.items():
-            if activity_name != target_activity:
-                assert updated_activities[activity_name]["participants"] == activity_data["participants"]
-            else:
-                assert email in updated_activities[activity_name]["participants"]
\ No newline at end of file
+        after = {activity_name: tuple(activities[activity_name]["participants"]) for activity_name in before}
+        assert before == after
+        assert email in activities[target_activity]["participants"]